@@ -368,7 +368,9 @@ def test(*paths, subprocess=True, rerun=0, **kwargs):
     parallel : bool, default is False
         Parallelize the test running using pytest-xdist. If `True` then pytest
         will automatically detect the number of CPU cores available and use them
-        all. Requires pytest-xdist.
+        all, distributing tests grouped by module/class (`--dist loadscope`)
+        so class-scoped fixtures are shared within a worker. Requires
+        pytest-xdist.
     store_durations : bool, False
         Store test durations into the file `.test_durations`. The is used by
         `pytest-split` to help determine more even splits when more than one
@@ -455,7 +457,10 @@ def test(*paths, subprocess=True, rerun=0, **kwargs):
         if not pytest_plugin_manager.has_xdist:
             msg = '`pytest-xdist` plugin required to run tests in parallel.'
             raise ModuleNotFoundError(msg)
-        args.extend(['-n', 'auto'])
+        # Distribute by module/class so that tests sharing class-scoped
+        # fixtures run on the same worker and those fixtures are only set up
+        # once per class.
+        args.extend(['-n', 'auto', '--dist', 'loadscope'])
 
     if kwargs.get('store_durations', False):
         if not pytest_plugin_manager.has_split: